@@ -55,10 +55,13 @@ file = open(filepath, 'w')
 for tet in strengths:
     file.write(f'{tet}\n')
 
+# Build Cubit model of in-vessel components
+stellarator.build_cubit_model(
+    skip_imprint=True,
+    legacy_faceting=True
+)
 # Export DAGMC neutronics H5M file
 stellarator.export_dagmc(
-    skip_imprint=True,
-    legacy_faceting=True,
     filename='nwl_geom',
     export_dir=export_dir
 )
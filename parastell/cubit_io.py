@@ -2,6 +2,8 @@ from pathlib import Path
 import os
 import inspect
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import cubit
 
@@ -29,6 +31,86 @@ def init_cubit():
         initialized = True
 
 
+def cmd_batch(commands, batch=False):
+    """Issues a sequence of commands to Coreform Cubit. In batch mode, the
+    commands are written to a temporary journal file which is played back by
+    Cubit in a single call.
+
+    Arguments:
+        commands (list of str): Cubit commands, in the order in which they are
+            to be executed.
+        batch (bool): dispatch all commands to Cubit in a single call rather
+            than one call per command (defaults to False).
+    """
+    init_cubit()
+
+    if not commands:
+        return
+
+    if batch:
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.jou', delete=False
+        ) as journal:
+            journal.write('\n'.join(commands) + '\n')
+
+        try:
+            cubit.cmd(f'playback "{journal.name}"')
+        finally:
+            os.unlink(journal.name)
+    else:
+        for command in commands:
+            cubit.cmd(command)
+
+
+def id_list_to_str(ids):
+    """Formats a collection of Cubit entity IDs as a space-separated string
+    for use in Cubit commands.
+
+    Arguments:
+        ids (iterable of int): Cubit entity IDs.
+
+    Returns:
+        id_str (str): space-separated list of IDs.
+    """
+    return ' '.join(map(str, ids))
+
+
+def _read_file(path, chunk_size=1 << 20):
+    """Reads a file to completion in fixed-size chunks, discarding the data.
+    (Internal function not intended to be called externally)
+
+    Arguments:
+        path (str): path to file.
+        chunk_size (int): number of bytes read per chunk (defaults to 1 MiB).
+    """
+    with open(path, 'rb') as file:
+        while file.read(chunk_size):
+            pass
+
+
+def read_ahead_step_files(filenames, import_dir, max_workers=None):
+    """Reads STEP files concurrently so that their contents are resident in
+    the operating system's page cache before being imported into Coreform
+    Cubit. Cubit's Python API is not re-entrant, so the imports themselves
+    must remain serial; only the disk reads are overlapped.
+
+    Arguments:
+        filenames (list of str): names of STEP input files, excluding '.step'
+            extension.
+        import_dir (str): directory from which to read STEP files.
+        max_workers (int): maximum number of reader threads (defaults to
+            None). If none is supplied, the ThreadPoolExecutor default is used.
+    """
+    import_paths = [
+        Path(import_dir) / Path(filename).with_suffix('.step')
+        for filename in filenames
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume results so that read errors are raised here
+        list(executor.map(_read_file, import_paths))
+
+
 def import_step_cubit(filename, import_dir):
     """Imports STEP file into Coreform Cubit.
 
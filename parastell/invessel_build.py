@@ -14,6 +14,10 @@ from .utils import (
     normalize, expand_ang_list, read_yaml_config, filter_kwargs, m2cm
 )
 
+radial_build_allowed_kwargs = [
+    'plasma_mat_tag', 'sol_mat_tag', 'chamber_mat_tag'
+]
+invessel_build_allowed_kwargs = ['repeat', 'num_ribs', 'num_rib_pts', 'scale']
 export_allowed_kwargs = ['export_cad_to_dagmc', 'dagmc_filename']
 
 
@@ -101,9 +105,7 @@ class InVesselBuild(object):
         self.num_rib_pts = 67
         self.scale = m2cm
 
-        for name in kwargs.keys() & (
-            'repeat', 'num_ribs', 'num_rib_pts', 'scale'
-        ):
+        for name in kwargs.keys() & invessel_build_allowed_kwargs:
             self.__setattr__(name,kwargs[name])
 
         self.Surfaces = {}
@@ -577,9 +579,7 @@ class RadialBuild(object):
         self.radial_build = radial_build
         self.split_chamber = split_chamber
 
-        for name in kwargs.keys() & (
-            'plasma_mat_tag', 'sol_mat_tag', 'chamber_mat_tag'
-        ):
+        for name in kwargs.keys() & radial_build_allowed_kwargs:
             self.__setattr__(name,kwargs[name])
 
         self._logger.info(
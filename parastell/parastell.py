@@ -1,26 +1,144 @@
-import argparse
-import yaml
+import importlib
+import os
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 
-import cubit
 import numpy as np
-import src.pystell.read_vmec as read_vmec
 
 from . import log
-
-from . import invessel_build as ivb
-from . import magnet_coils as mc
-from . import source_mesh as sm
-from . import cubit_io
 from .utils import read_yaml_config, filter_kwargs, m2cm
 
-build_cubit_model_allowed_kwargs = ['skip_imprint', 'legacy_faceting']
-export_dagmc_allowed_kwargs = ['faceting_tolerance', 'length_tolerance',
-                               'normal_tolerance', 'anisotropic_ratio',
-                               'deviation_angle']
+build_cubit_model_allowed_kwargs = [
+    'skip_imprint', 'legacy_faceting', 'batch_commands', 'read_ahead'
+]
+
+
+@dataclass(slots=True)
+class DagmcExportConfig(object):
+    """Faceting parameters for DAGMC neutronics model export via Coreform
+    Cubit. See Stellarator.export_dagmc for descriptions of each parameter.
+    """
+    faceting_tolerance: float | None = None
+    length_tolerance: float | None = None
+    normal_tolerance: float | None = None
+    anisotropic_ratio: float = 100.0
+    deviation_angle: float = 5.0
+
+
+export_dagmc_allowed_kwargs = [
+    field.name for field in fields(DagmcExportConfig)
+]
+
+mat_tag_pattern = re.compile(r'[^"\'\s]+')
+
+
+_lazy_modules = {}
+
+
+def _lazy_import(name):
+    """Imports a module on first use and caches it for subsequent calls. Used
+    to defer loading of heavyweight dependencies, such as Coreform Cubit and
+    the ParaStell component modules, until they are needed.
+    (Internal function not intended to be called externally)
+
+    Arguments:
+        name (str): absolute module name, or module name relative to the
+            ParaStell package if prefixed with '.'.
+
+    Returns:
+        module (module): imported module.
+    """
+    try:
+        return _lazy_modules[name]
+    except KeyError:
+        module = importlib.import_module(name, package=__package__)
+        _lazy_modules[name] = module
+        return module
+
+
+@lru_cache(maxsize=8)
+def _load_vmec(path, mtime, size):
+    """Loads plasma equilibrium VMEC data. Parsed VMEC objects are cached on
+    file path, modification time and size so that repeated loads of an
+    unmodified file do not re-read it.
+    (Internal function not intended to be called externally)
+
+    Arguments:
+        path (str): absolute path to plasma equilibrium VMEC file.
+        mtime (int): modification time of VMEC file [ns].
+        size (int): size of VMEC file [bytes].
+
+    Returns:
+        vmec_obj (object): plasma equilibrium VMEC object.
+    """
+    read_vmec = _lazy_import('src.pystell.read_vmec')
+
+    return read_vmec.VMECData(path)
+
+
+def clear_vmec_cache():
+    """Clears the cache of parsed plasma equilibrium VMEC data.
+    """
+    _load_vmec.cache_clear()
+
+
+def check_mat_tag(mat_tag, logger):
+    """Checks that a DAGMC material tag can be quoted in Cubit commands, i.e.,
+    that it is non-empty and contains no quotation marks or whitespace.
+
+    Arguments:
+        mat_tag (str or int): DAGMC material tag.
+        logger (object): logger object.
+    """
+    if not mat_tag_pattern.fullmatch(str(mat_tag)):
+        e = ValueError(
+            f'Material tag {mat_tag!r} must be non-empty and must not contain '
+            'quotation marks or whitespace.'
+        )
+        logger.error(e.args[0])
+        raise e
+
+
+def material_block_commands(mat_tag, block_id, vol_id_str):
+    """Constructs the commands required to make a material block using
+    Cubit's native capabilities.
+
+    Arguments:
+       mat_tag (str) : name of material block
+       block_id (int) : block number
+       vol_id_str (str) : space-separated list of volume ids
+
+    Returns:
+        commands (list of str): Cubit commands defining the material block.
+    """
+    commands = [
+        f'create material "{mat_tag}" property_group "CUBIT-ABAQUS"',
+        f'block {block_id} add volume {vol_id_str}',
+        f'block {block_id} material "{mat_tag}"'
+    ]
+
+    return commands
+
+
+def material_group_commands(mat_tag, vol_id_str):
+    """Constructs the commands required to add volumes to a DAGMC material
+    group for legacy faceting.
+
+    Arguments:
+       mat_tag (str) : name of material group, excluding 'mat:' prefix
+       vol_id_str (str) : space-separated list of volume ids
+
+    Returns:
+        commands (list of str): Cubit commands defining the material group.
+    """
+    commands = [f'group "mat:{mat_tag}" add volume {vol_id_str}']
+
+    return commands
 
 
-def make_material_block(mat_tag, block_id, vol_id_str):
+def make_material_block(mat_tag, block_id, vol_id_str, batch_commands=False):
     """Issue commands to make a material block using Cubit's
     native capabilities.
 
@@ -28,17 +146,14 @@ def make_material_block(mat_tag, block_id, vol_id_str):
        mat_tag (str) : name of material block
        block_id (int) : block number
        vol_id_str (str) : space-separated list of volume ids
+       batch_commands (bool) : dispatch the commands to Cubit in a single call
+           (optional, defaults to False).
     """
+    cubit_io = _lazy_import('.cubit_io')
 
-    cubit.cmd(
-        f'create material "{mat_tag}" property_group '
-        '"CUBIT-ABAQUS"'
-    )
-    cubit.cmd(
-        f'block {block_id} add volume {vol_id_str}'
-    )
-    cubit.cmd(
-        f'block {block_id} material "{mat_tag}"'
+    cubit_io.cmd_batch(
+        material_block_commands(mat_tag, block_id, vol_id_str),
+        batch=batch_commands
     )
 
 
@@ -53,11 +168,18 @@ class Stellarator(object):
     VMEC data and a structured, uniform grid in magnetic flux space.
 
     Arguments:
-        vmec_file (str): path to plasma equilibrium VMEC file.
+        vmec_file (str): path to plasma equilibrium VMEC file. Parsed VMEC
+            data is cached and shared between instances referencing the same,
+            unmodified file; see clear_vmec_cache.
         logger (object): logger object (optional, defaults to None). If no
             logger is supplied, a default logger will be instantiated.
     """
 
+    __slots__ = (
+        '_logger', '_vmec_file', '_vmec_obj', 'invessel_build', 'magnet_set',
+        'source_mesh', 'legacy_faceting'
+    )
+
     def __init__(
         self,
         vmec_file,
@@ -78,8 +200,22 @@ class Stellarator(object):
     @vmec_file.setter
     def vmec_file(self, file):
         self._vmec_file = file
+
+        if os.path.splitext(self._vmec_file)[1].lower() != '.nc':
+            e = ValueError(
+                f'VMEC file {self._vmec_file} must be a netCDF file with '
+                '".nc" extension.'
+            )
+            self._logger.error(e.args[0])
+            raise e
+
         try:
-            self._vmec_obj = read_vmec.VMECData(self._vmec_file)
+            file_stat = os.stat(self._vmec_file)
+            self._vmec_obj = _load_vmec(
+                os.path.abspath(self._vmec_file),
+                file_stat.st_mtime_ns,
+                file_stat.st_size
+            )
         except Exception as e:
             self._logger.error(e.args[0])
             raise e
@@ -92,6 +228,12 @@ class Stellarator(object):
     def logger(self, logger_object):
         self._logger = log.check_init(logger_object)
 
+    @property
+    def radial_build(self):
+        if self.invessel_build is None:
+            return None
+        return self.invessel_build.radial_build
+
     def construct_invessel_build(
         self, toroidal_angles, poloidal_angles, wall_s, radial_build, split_chamber=False, **kwargs
     ):
@@ -134,6 +276,9 @@ class Stellarator(object):
             sol_mat_tag (str): alternate DAGMC material tag to use for
                 scrape-off layer. If none is supplied, 'Vacuum' will be used
                 (defaults to None).
+            chamber_mat_tag (str): alternate DAGMC material tag to use for
+                interior vacuum chamber. If none is supplied, 'Vacuum' will be
+                used (defaults to None).
             repeat (int): number of times to repeat build segment for full model
                 (defaults to 0).
             num_ribs (int): total number of ribs over which to loft for each
@@ -148,21 +293,23 @@ class Stellarator(object):
             scale (float): a scaling factor between the units of VMEC and [cm]
                 (defaults to m2cm = 100).
         """
-        self.radial_build = ivb.RadialBuild(
+        ivb = _lazy_import('.invessel_build')
+
+        radial_build_obj = ivb.RadialBuild(
             toroidal_angles,
             poloidal_angles,
             wall_s,
             radial_build,
             split_chamber=split_chamber,
             logger=self._logger,
-            **kwargs
+            **(filter_kwargs(kwargs, ivb.radial_build_allowed_kwargs))
         )
 
         self.invessel_build = ivb.InVesselBuild(
             self._vmec_obj,
-            self.radial_build,
+            radial_build_obj,
             logger=self._logger,
-            **kwargs
+            **(filter_kwargs(kwargs, ivb.invessel_build_allowed_kwargs))
         )
 
         self.invessel_build.populate_surfaces()
@@ -217,6 +364,8 @@ class Stellarator(object):
             mat_tag (str): DAGMC material tag to use for magnets in DAGMC
                 neutronics model (defaults to 'magnets').
         """
+        mc = _lazy_import('.magnet_coils')
+
         self.magnet_set = mc.MagnetSet(
             coils_file,
             cross_section,
@@ -275,6 +424,8 @@ class Stellarator(object):
             scale (float): a scaling factor between the units of VMEC and [cm]
                 (defaults to m2cm = 100).
         """
+        sm = _lazy_import('.source_mesh')
+
         self.source_mesh = sm.SourceMesh(
             self._vmec_obj,
             mesh_size,
@@ -300,91 +451,174 @@ class Stellarator(object):
             export_dir=export_dir
         )
 
-    def _import_ivb_step(self):
-        """Imports STEP files from in-vessel build into Coreform Cubit.
+    def _import_and_tag(
+        self, has_ivb, has_magnets, legacy_faceting=True, batch_commands=False,
+        read_ahead=False
+    ):
+        """Imports STEP files from in-vessel build into Coreform Cubit and
+        applies material tags to corresponding CAD volumes for DAGMC
+        neutronics model export in a single pass over the radial build.
+        Tagging commands are collected as volumes are imported and dispatched
+        to Cubit once all imports are complete.
         (Internal function not intended to be called externally)
-        """
-        for name, data in (
-            self.invessel_build.radial_build.radial_build.items()
-        ):
-            vol_id = cubit_io.import_step_cubit(
-                name, self.invessel_build.export_dir
-            )
-            data['vol_id'] = vol_id
 
-    def _tag_materials_legacy(self):
-        """Applies material tags to corresponding CAD volumes for legacy DAGMC
-        neutronics model export.
-        (Internal function not intended to be called externally)
+        Arguments:
+            has_ivb (bool): whether the model includes in-vessel components.
+            has_magnets (bool): whether the model includes magnet coils.
+            legacy_faceting (bool): tag materials for legacy rather than
+                native faceting (optional, defaults to True).
+            batch_commands (bool): dispatch all tagging commands to Cubit in a
+                single call (optional, defaults to False).
+            read_ahead (bool): read in-vessel component STEP files in
+                parallel before importing them (optional, defaults to False).
         """
-        if self.magnet_set:
-            vol_id_str = " ".join(
-                str(i) for i in list(self.magnet_set.volume_ids)
-            )
-            cubit.cmd(
-                f'group "mat:{self.magnet_set.mat_tag}" add volume {vol_id_str}'
-            )
+        cubit_io = _lazy_import('.cubit_io')
+
+        if legacy_faceting:
+            commands = []
+        else:
+            commands = ['set duplicate block elements off']
 
-        if self.invessel_build:
-            for data in (
-                self.invessel_build.radial_build.radial_build.values()
-            ):
-                cubit.cmd(
-                    f'group "mat:{data["mat_tag"]}" add volume {data["vol_id"]}'
+        if has_magnets:
+            vol_id_str = cubit_io.id_list_to_str(self.magnet_set.volume_ids)
+            if legacy_faceting:
+                commands.extend(
+                    material_group_commands(self.magnet_set.mat_tag, vol_id_str)
+                )
+            else:
+                block_id = min(self.magnet_set.volume_ids)
+                commands.extend(
+                    material_block_commands(
+                        self.magnet_set.mat_tag, block_id, vol_id_str
+                    )
                 )
 
-    def _tag_materials_native(self):
-        """Applies material tags to corresponding CAD volumes for native DAGMC
-        neutronics model export.
+        if has_ivb:
+            radial_build = self.radial_build.radial_build
+            export_dir = self.invessel_build.export_dir
+
+            if read_ahead:
+                cubit_io.read_ahead_step_files(radial_build.keys(), export_dir)
+
+            for name, data in radial_build.items():
+                vol_id = cubit_io.import_step_cubit(name, export_dir)
+                data['vol_id'] = vol_id
+
+                if legacy_faceting:
+                    commands.extend(
+                        material_group_commands(data['mat_tag'], str(vol_id))
+                    )
+                else:
+                    commands.extend(
+                        material_block_commands(
+                            data['mat_tag'], vol_id, str(vol_id)
+                        )
+                    )
+
+        cubit_io.cmd_batch(commands, batch=batch_commands)
+
+    def _imprint_and_merge_local(
+        self, has_ivb, has_magnets, batch_commands=False
+    ):
+        """Imprints and merges only those volumes expected to share surfaces,
+        namely radially adjacent in-vessel components and the set of magnet
+        volumes, rather than checking every pair of volumes in the model.
+        Assumes that the radial_build dictionary is ordered radially outward.
+        Note that overlaps between magnet volumes and in-vessel components
+        will not be imprinted or merged in this workflow.
         (Internal function not intended to be called externally)
+
+        Arguments:
+            has_ivb (bool): whether the model includes in-vessel components.
+            has_magnets (bool): whether the model includes magnet coils.
+            batch_commands (bool): dispatch all imprint and merge commands to
+                Cubit in a single call (optional, defaults to False).
         """
-        cubit.cmd('set duplicate block elements off')
-
-        if self.magnet_set:
-            vol_list = list(self.magnet_set.volume_ids)
-            block_id = min(vol_list)
-            vol_id_str = " ".join(str(i) for i in vol_list)
-            make_material_block(self.magnet_set.mat_tag, block_id, vol_id_str)
-
-        if self.invessel_build:
-            for data in (
-                self.invessel_build.radial_build.radial_build.values()
-            ):
-                block_id = data['vol_id']
-                vol_id_str = str(block_id)
-                make_material_block(data['mat_tag'], block_id, vol_id_str)
-
-    def build_cubit_model(self, skip_imprint=False, legacy_faceting=True):
+        cubit_io = _lazy_import('.cubit_io')
+
+        imprint_commands = []
+        merge_commands = []
+
+        if has_ivb:
+            radial_build = self.radial_build.radial_build
+            vol_ids = [data['vol_id'] for data in radial_build.values()]
+            for inner_vol_id, outer_vol_id in zip(vol_ids[:-1], vol_ids[1:]):
+                imprint_commands.append(
+                    f'imprint volume {inner_vol_id} {outer_vol_id}'
+                )
+                merge_commands.append(
+                    f'merge volume {inner_vol_id} {outer_vol_id}'
+                )
+
+        if has_magnets:
+            vol_id_str = cubit_io.id_list_to_str(self.magnet_set.volume_ids)
+            imprint_commands.append(f'imprint volume {vol_id_str}')
+            merge_commands.append(f'merge volume {vol_id_str}')
+
+        cubit_io.cmd_batch(
+            imprint_commands + merge_commands, batch=batch_commands
+        )
+
+    def build_cubit_model(
+        self, skip_imprint=False, legacy_faceting=True, batch_commands=False,
+        read_ahead=False
+    ):
         """Build model for DAGMC neutronics H5M file of Parastell components via
         Coreform Cubit
 
         Arguments:
-            skip_imprint (bool): choose whether to imprint and merge all in
-                Coreform Cubit or to merge surfaces based on import order and
-                geometry information (optional, defaults to False).
+            skip_imprint (bool or str): choose whether to imprint and merge
+                all in Coreform Cubit or to merge surfaces based on import
+                order and geometry information (optional, defaults to False).
+                If 'local', only radially adjacent in-vessel components are
+                imprinted and merged with each other, and magnet volumes with
+                each other.
             legacy_faceting (bool): choose legacy or native faceting for DAGMC
                 export (optional, defaults to True).
+            batch_commands (bool): dispatch material tagging commands, and
+                the imprint and merge commands of the 'local' skip_imprint
+                mode, to Coreform Cubit in a single call rather than one call
+                per command (optional, defaults to False).
+            read_ahead (bool): read in-vessel component STEP files in parallel
+                before importing them into Coreform Cubit, which may reduce
+                import time for STEP files not already in the operating
+                system's file cache, e.g. those exported by an earlier process
+                (optional, defaults to False).
         """
+        cubit = _lazy_import('cubit')
+
         self.legacy_faceting = legacy_faceting
 
         self._logger.info(
             'Building DAGMC neutronics model via Coreform Cubit...'
         )
 
-        if self.invessel_build:
-            self._import_ivb_step()
+        has_ivb = self.invessel_build is not None
+        has_magnets = self.magnet_set is not None
 
-        if skip_imprint:
-            self.invessel_build.merge_layer_surfaces()
+        # Check all material tags before any geometry is imported into Cubit
+        if has_magnets:
+            check_mat_tag(self.magnet_set.mat_tag, self._logger)
+        if has_ivb:
+            for data in self.radial_build.radial_build.values():
+                check_mat_tag(data['mat_tag'], self._logger)
+
+        self._import_and_tag(
+            has_ivb, has_magnets, legacy_faceting=legacy_faceting,
+            batch_commands=batch_commands, read_ahead=read_ahead
+        )
+
+        if skip_imprint == 'local':
+            self._imprint_and_merge_local(
+                has_ivb, has_magnets, batch_commands=batch_commands
+            )
+        elif skip_imprint:
+            if has_ivb:
+                self.invessel_build.merge_layer_surfaces()
         else:
             cubit.cmd('imprint volume all')
             cubit.cmd('merge volume all')
 
-        if legacy_faceting:
-            self._tag_materials_legacy()
-        else:
-            self._tag_materials_native()
-
     def export_dagmc(self, filename='dagmc', export_dir='', **kwargs):
         """Exports DAGMC neutronics H5M file of ParaStell components via
         Coreform Cubit.
@@ -413,7 +647,18 @@ class Stellarator(object):
                 surface (i.e., lesser deviation angle results in more elements
                 in areas with higher curvature) (defaults to 5.0). This
                 attribute is used only for the native faceting method.
+
+        Unsupported keyword arguments raise a ValueError.
         """
+        dagmc_cfg = DagmcExportConfig(
+            **filter_kwargs(
+                kwargs, export_dagmc_allowed_kwargs, all_kwargs=True,
+                fn_name='export_dagmc', logger=self._logger
+            )
+        )
+
+        cubit_io = _lazy_import('.cubit_io')
+
         cubit_io.init_cubit()
 
         self._logger.info(
@@ -422,15 +667,18 @@ class Stellarator(object):
 
         if self.legacy_faceting:
             cubit_io.export_dagmc_cubit_legacy(
+                faceting_tolerance=dagmc_cfg.faceting_tolerance,
+                length_tolerance=dagmc_cfg.length_tolerance,
+                normal_tolerance=dagmc_cfg.normal_tolerance,
                 filename=filename,
-                export_dir=export_dir,
-                **kwargs
+                export_dir=export_dir
             )
         else:
             cubit_io.export_dagmc_cubit_native(
+                anisotropic_ratio=dagmc_cfg.anisotropic_ratio,
+                deviation_angle=dagmc_cfg.deviation_angle,
                 filename=filename,
-                export_dir=export_dir,
-                **kwargs
+                export_dir=export_dir
             )
 
     def export_cub5(self, filename='stellarator', export_dir=''):
@@ -442,6 +690,8 @@ class Stellarator(object):
             export_dir (str): directory to which to export DAGMC output file
                 (optional, defaults to empty string).
         """
+        cubit_io = _lazy_import('.cubit_io')
+
         cubit_io.init_cubit()
 
         self._logger.info(
@@ -451,10 +701,54 @@ class Stellarator(object):
         cubit_io.export_cub5(filename=filename,
                              export_dir=export_dir)
 
+    @classmethod
+    def export_batch(cls, configs, logger=None):
+        """Constructs and exports a series of ParaStell models within a single
+        Coreform Cubit session. Cubit is initialized once and reset after each
+        configuration, so the Cubit start-up cost is paid once for the batch
+        rather than once per configuration.
+
+        Arguments:
+            configs (list of dict): ParaStell configurations, each structured
+                as the YAML configuration file read by the 'parastell' command
+                line script. Each must include 'vmec_file' and may include
+                'invessel_build', 'magnet_coils', 'source_mesh',
+                'dagmc_export' and 'cub5_export' entries; only those
+                components present are constructed. An additional
+                'export_dir' entry specifies the directory to which output
+                files of that configuration are exported (defaults to empty
+                string). Output filenames should differ between
+                configurations sharing an export directory to prevent
+                overwriting files.
+            logger (object): logger object (optional, defaults to None). If no
+                logger is supplied, a default logger will be instantiated.
+        """
+        cubit_io = _lazy_import('.cubit_io')
+        cubit = _lazy_import('cubit')
+
+        cubit_io.init_cubit()
+        cubit.cmd('reset')
+
+        for config in configs:
+            try:
+                build_stellarator(
+                    config,
+                    export_dir=config.get('export_dir', ''),
+                    build_ivb='invessel_build' in config,
+                    build_magnets='magnet_coils' in config,
+                    build_source='source_mesh' in config,
+                    logger=logger,
+                    stellarator_cls=cls
+                )
+            finally:
+                cubit.cmd('reset')
+
 
 def parse_args():
     """Parser for running as a script.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(prog='stellarator')
 
     parser.add_argument(
@@ -520,7 +814,9 @@ def parse_args():
 def check_inputs(
     invessel_build, magnet_coils, source_mesh, dagmc_export, logger
 ):
-    """Checks inputs for consistency across ParaStell classes.
+    """Checks inputs for consistency across ParaStell classes. Checks
+    involving a component whose parameters are not supplied (None or empty)
+    are skipped.
 
     Arguments:
         invessel_build (dict): dictionary of RadialBuild and InVesselBuild
@@ -530,16 +826,21 @@ def check_inputs(
         dagmc_export (dict): dictionary of DAGMC export parameters.
         logger (object): logger object.
     """
-    if 'repeat' in invessel_build:
-        repeat = invessel_build['repeat']
-    else:
-        repeat = 0
+    if invessel_build:
+        if 'repeat' in invessel_build:
+            repeat = invessel_build['repeat']
+        else:
+            repeat = 0
 
-    ivb_tor_ext = (repeat + 1) * invessel_build['toroidal_angles'][-1]
-    mag_tor_ext = magnet_coils['toroidal_extent']
-    src_tor_ext = source_mesh['toroidal_extent']
+        ivb_tor_ext = (repeat + 1) * invessel_build['toroidal_angles'][-1]
 
-    if ivb_tor_ext != mag_tor_ext:
+    if magnet_coils:
+        mag_tor_ext = magnet_coils['toroidal_extent']
+
+    if source_mesh:
+        src_tor_ext = source_mesh['toroidal_extent']
+
+    if invessel_build and magnet_coils and ivb_tor_ext != mag_tor_ext:
         w = Warning(
             f'The total toroidal extent of the in-vessel build, {ivb_tor_ext} '
             'degrees, does not match the toroidal extent of the magnet coils, '
@@ -547,7 +848,7 @@ def check_inputs(
         )
         logger.warning(w.args[0])
 
-    if ivb_tor_ext != src_tor_ext:
+    if invessel_build and source_mesh and ivb_tor_ext != src_tor_ext:
         w = Warning(
             f'The total toroidal extent of the in-vessel build, {ivb_tor_ext} '
             'degrees, does not match the toroidal extent of the source mesh, '
@@ -555,32 +856,34 @@ def check_inputs(
         )
         logger.warning(w.args[0])
 
-    if mag_tor_ext != src_tor_ext:
+    if magnet_coils and source_mesh and mag_tor_ext != src_tor_ext:
         w = Warning(
             f'The toroidal extent of the magnet coils, {mag_tor_ext} degrees, '
             f'does not match that of the source mesh, {src_tor_ext} degrees.'
         )
         logger.warning(w.args[0])
 
-    if 'scale' in invessel_build:
-        ivb_scale = invessel_build['scale']
-    else:
-        ivb_scale = m2cm
+    if invessel_build and source_mesh:
+        if 'scale' in invessel_build:
+            ivb_scale = invessel_build['scale']
+        else:
+            ivb_scale = m2cm
 
-    if 'scale' in source_mesh:
-        src_scale = source_mesh['scale']
-    else:
-        src_scale = m2cm
+        if 'scale' in source_mesh:
+            src_scale = source_mesh['scale']
+        else:
+            src_scale = m2cm
 
-    if ivb_scale != src_scale:
-        e = ValueError(
-            f'The conversion scale of the in-vessel build, {ivb_scale}, does '
-            f'not match that of the source mesh, {src_scale}.'
-        )
-        logger.error(e.args[0])
-        raise e
+        if ivb_scale != src_scale:
+            e = ValueError(
+                f'The conversion scale of the in-vessel build, {ivb_scale}, '
+                f'does not match that of the source mesh, {src_scale}.'
+            )
+            logger.error(e.args[0])
+            raise e
 
     if (
+        invessel_build and
         'export_cad_to_dagmc' in invessel_build and
         invessel_build['export_cad_to_dagmc']
     ):
@@ -589,7 +892,7 @@ def check_inputs(
         else:
             ivb_dagmc_filename = 'dagmc'
 
-        if 'filename' in dagmc_export:
+        if dagmc_export and 'filename' in dagmc_export:
             ps_dagmc_filename = dagmc_export['filename']
         else:
             ps_dagmc_filename = 'dagmc'
@@ -604,81 +907,128 @@ def check_inputs(
             raise e
 
 
-def parastell():
-    """Main method when run as a command line script.
+def build_stellarator(
+    config, export_dir='', build_ivb=True, build_magnets=True,
+    build_source=True, logger=None, stellarator_cls=None
+):
+    """Checks a ParaStell configuration for consistency, then constructs and
+    exports the requested components and, if in-vessel components or magnets
+    are built, a DAGMC neutronics model via Coreform Cubit.
+
+    Arguments:
+        config (dict): ParaStell configuration, structured as the YAML
+            configuration file read by the 'parastell' command line script.
+        export_dir (str): directory to which to export output files (optional,
+            defaults to empty string).
+        build_ivb (bool): construct and export in-vessel components (optional,
+            defaults to True).
+        build_magnets (bool): construct and export magnet coils (optional,
+            defaults to True).
+        build_source (bool): construct and export source mesh (optional,
+            defaults to True).
+        logger (object): logger object (optional, defaults to None). If no
+            logger is supplied, a default logger will be instantiated.
+        stellarator_cls (type): Stellarator class or subclass to instantiate
+            (optional, defaults to None). If none is supplied, Stellarator
+            will be used.
+
+    Returns:
+        stellarator (object): Stellarator class object.
     """
-    args = parse_args()
+    logger = log.check_init(logger)
 
-    all_data = read_yaml_config(args.filename)
+    if stellarator_cls is None:
+        stellarator_cls = Stellarator
 
-    if args.logger == True:
-        logger = log.init()
-    else:
-        logger = log.NullLogger()
+    dagmc_export = config.get('dagmc_export', {})
 
     check_inputs(
-        all_data['invessel_build'],
-        all_data['magnet_coils'],
-        all_data['source_mesh'],
-        all_data['dagmc_export'],
+        config.get('invessel_build'),
+        config.get('magnet_coils'),
+        config.get('source_mesh'),
+        dagmc_export,
         logger
     )
 
-    vmec_file = all_data['vmec_file']
+    stellarator = stellarator_cls(config['vmec_file'], logger=logger)
 
-    stellarator = Stellarator(
-        vmec_file,
-        logger=logger
-    )
-
-    if args.ivb:
-        invessel_build = all_data['invessel_build']
+    if build_ivb:
+        ivb = _lazy_import('.invessel_build')
+        invessel_build = config['invessel_build']
         stellarator.construct_invessel_build(**invessel_build)
         stellarator.export_invessel_build(
-            export_dir=args.export_dir,
+            export_dir=export_dir,
             **(filter_kwargs(invessel_build, ivb.export_allowed_kwargs))
         )
 
-    if args.magnets:
-        magnet_coils = all_data['magnet_coils']
+    if build_magnets:
+        mc = _lazy_import('.magnet_coils')
+        magnet_coils = config['magnet_coils']
         stellarator.construct_magnets(**magnet_coils)
         stellarator.export_magnets(
-            export_dir=args.export_dir,
+            export_dir=export_dir,
             **(filter_kwargs(magnet_coils, mc.export_allowed_kwargs))
         )
 
-    if args.source:
-        source_mesh = all_data['source_mesh']
+    if build_source:
+        sm = _lazy_import('.source_mesh')
+        source_mesh = config['source_mesh']
         stellarator.construct_source_mesh(**source_mesh)
         stellarator.export_source_mesh(
-            export_dir=args.export_dir,
+            export_dir=export_dir,
             **(filter_kwargs(source_mesh, sm.export_allowed_kwargs))
         )
 
-    if args.ivb or args.magnets:
-        dagmc_export = all_data['dagmc_export']
+    if build_ivb or build_magnets:
         stellarator.build_cubit_model(
             **(filter_kwargs(dagmc_export, build_cubit_model_allowed_kwargs))
         )
         stellarator.export_dagmc(
-            export_dir=args.export_dir,
-            **(filter_kwargs(dagmc_export, export_dagmc_allowed_kwargs))
+            export_dir=export_dir,
+            **(filter_kwargs(
+                dagmc_export, ['filename'] + export_dagmc_allowed_kwargs
+            ))
         )
 
-        if all_data['cub5_export']:
-            stellarator.export_cub5(export_dir=args.export_dir)
+        if config.get('cub5_export', False):
+            stellarator.export_cub5(export_dir=export_dir)
+
+    return stellarator
+
+
+def parastell():
+    """Main method when run as a command line script.
+    """
+    args = parse_args()
+
+    export_dir = str(Path(args.export_dir).resolve())
+
+    all_data = read_yaml_config(args.filename)
+
+    if args.logger == True:
+        logger = log.init()
+    else:
+        logger = log.NullLogger()
+
+    build_stellarator(
+        all_data,
+        export_dir=export_dir,
+        build_ivb=args.ivb,
+        build_magnets=args.magnets,
+        build_source=args.source,
+        logger=logger
+    )
 
     if args.nwl:
-        if not args.ivb:
-            invessel_build = all_data['invessel_build']
-            if not args.magnets:
-                dagmc_export = all_data['dagmc_export']
+        invessel_build = all_data['invessel_build']
 
+        cubit_io = _lazy_import('.cubit_io')
         if cubit_io.initialized:
+            cubit = _lazy_import('cubit')
             cubit.cmd('new')
 
         nwl_geom = Stellarator(
-            vmec_file,
+            all_data['vmec_file'],
             logger=logger
         )
 
@@ -687,7 +1037,7 @@ def parastell():
         ]
 
         nwl_build = {}
-        for key in nwl_keys:
+        for key in nwl_required_keys:
             nwl_build[key] = invessel_build[key]
         nwl_build['radial_build'] = {}
 
@@ -699,12 +1049,12 @@ def parastell():
             nwl_build[key] = invessel_build[key]
 
         nwl_geom.construct_invessel_build(**nwl_build)
-        nwl_geom.export_invessel_build(export_dir=args.export_dir)
+        nwl_geom.export_invessel_build(export_dir=export_dir)
 
+        nwl_geom.build_cubit_model(skip_imprint=True)
         nwl_geom.export_dagmc(
-            skip_imprint=True,
             filename='nwl_geom',
-            export_dir=args.export_dir
+            export_dir=export_dir
         )
 
 
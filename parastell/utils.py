@@ -1,5 +1,5 @@
-import yaml
 import math
+from pathlib import Path
 
 import numpy as np
 
@@ -62,8 +62,14 @@ def expand_ang_list(ang_list, num_ang):
 def read_yaml_config(filename):
     """Read YAML file describing ParaStell configuration and extract all data.
     """
-    with open(filename) as yaml_file:
-        all_data = yaml.safe_load(yaml_file)
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    all_data = yaml.load(Path(filename).read_bytes(), Loader=SafeLoader)
 
     return all_data
 
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 import parastell.parastell as ps
+from parastell.log import NullLogger
 
 
 def remove_files():
@@ -20,6 +21,16 @@ def remove_files():
         Path.unlink('magnet_mesh.h5m')
     if Path('dagmc.h5m').exists():
         Path.unlink('dagmc.h5m')
+    if Path('dagmc_batch.h5m').exists():
+        Path.unlink('dagmc_batch.h5m')
+    if Path('dagmc_read_ahead.h5m').exists():
+        Path.unlink('dagmc_read_ahead.h5m')
+    if Path('dagmc_local.h5m').exists():
+        Path.unlink('dagmc_local.h5m')
+    if Path('dagmc_batch_0.h5m').exists():
+        Path.unlink('dagmc_batch_0.h5m')
+    if Path('dagmc_batch_1.h5m').exists():
+        Path.unlink('dagmc_batch_1.h5m')
     if Path('dagmc.cub5').exists():
         Path.unlink('dagmc.cub5')
     if Path('source_mesh.h5m').exists():
@@ -42,6 +53,84 @@ def stellarator():
     return stellarator_obj
 
 
+def test_vmec_file_cache(stellarator):
+
+    vmec_file = Path('files_for_tests') / 'wout_vmec.nc'
+
+    stellarator_dup = ps.Stellarator(vmec_file)
+
+    assert stellarator_dup._vmec_obj is stellarator._vmec_obj
+
+    ps.clear_vmec_cache()
+
+    stellarator_new = ps.Stellarator(vmec_file)
+
+    assert stellarator_new._vmec_obj is not stellarator._vmec_obj
+
+
+def test_export_dagmc_kwargs(stellarator):
+
+    with pytest.raises(ValueError):
+        stellarator.export_dagmc(skip_imprint=True)
+
+
+def test_vmec_file_extension():
+
+    with pytest.raises(ValueError):
+        ps.Stellarator(Path('files_for_tests') / 'coils.example')
+
+
+def test_material_commands():
+
+    mat_tag_exp = 'vac_vessel'
+    block_id_exp = 3
+    vol_id_str_exp = '3'
+
+    commands = ps.material_block_commands(
+        mat_tag_exp, block_id_exp, vol_id_str_exp
+    )
+
+    assert commands == [
+        'create material "vac_vessel" property_group "CUBIT-ABAQUS"',
+        'block 3 add volume 3',
+        'block 3 material "vac_vessel"'
+    ]
+
+    commands = ps.material_group_commands(mat_tag_exp, vol_id_str_exp)
+
+    assert commands == ['group "mat:vac_vessel" add volume 3']
+
+
+def test_check_mat_tag():
+
+    logger = NullLogger()
+
+    for mat_tag in ['vac_vessel', '1', 1, '316L', 'mat.1', 'Fe-56']:
+        ps.check_mat_tag(mat_tag, logger)
+
+    for mat_tag in ['', 'vac vessel', '"vac_vessel"', "vac'vessel", 'a\nb']:
+        with pytest.raises(ValueError):
+            ps.check_mat_tag(mat_tag, logger)
+
+
+def test_check_inputs():
+
+    logger = NullLogger()
+
+    invessel_build = {
+        'toroidal_angles': [0.0, 5.0, 10.0, 15.0],
+        'scale': 100
+    }
+    magnet_coils = {'toroidal_extent': 15.0}
+    source_mesh = {'toroidal_extent': 15.0, 'scale': 1}
+
+    ps.check_inputs(None, magnet_coils, None, None, logger)
+    ps.check_inputs(invessel_build, magnet_coils, None, {}, logger)
+
+    with pytest.raises(ValueError):
+        ps.check_inputs(invessel_build, None, source_mesh, None, logger)
+
+
 def test_parastell(stellarator):
 
     remove_files()
@@ -128,3 +217,166 @@ def test_parastell(stellarator):
     assert Path(filename_exp).with_suffix('.cub5').exists()
 
     remove_files()
+
+
+def reset_cubit():
+
+    import parastell.cubit_io as cubit_io
+
+    cubit_io.init_cubit()
+    cubit_io.cubit.cmd('new')
+
+
+def construct_model(stellarator, magnets=True):
+
+    reset_cubit()
+
+    toroidal_angles = [0.0, 5.0, 10.0, 15.0]
+    poloidal_angles = [0.0, 120.0, 240.0, 360.0]
+    wall_s = 1.08
+    radial_build_dict = {
+        'component': {
+            'thickness_matrix': np.ones(
+                (len(toroidal_angles), len(poloidal_angles))
+            )*10
+        }
+    }
+
+    stellarator.construct_invessel_build(
+        toroidal_angles,
+        poloidal_angles,
+        wall_s,
+        radial_build_dict,
+        num_ribs=11
+    )
+    stellarator.export_invessel_build()
+
+    if magnets:
+        coils_file = Path('files_for_tests') / 'coils.example'
+
+        stellarator.construct_magnets(
+            coils_file,
+            ['circle', 25],
+            90.0,
+            sample_mod=6
+        )
+
+
+@pytest.mark.parametrize('batch_commands', [False, True])
+def test_local_imprint(stellarator, batch_commands):
+
+    remove_files()
+
+    construct_model(stellarator)
+
+    filename_exp = 'dagmc_local'
+
+    stellarator.build_cubit_model(
+        skip_imprint='local',
+        batch_commands=batch_commands
+    )
+    stellarator.export_dagmc(filename=filename_exp)
+
+    assert Path(filename_exp).with_suffix('.h5m').exists()
+
+    remove_files()
+
+
+@pytest.mark.parametrize('legacy_faceting', [True, False])
+def test_batch_commands(stellarator, legacy_faceting):
+
+    remove_files()
+
+    construct_model(stellarator)
+
+    filename_exp = 'dagmc_batch'
+
+    stellarator.build_cubit_model(
+        legacy_faceting=legacy_faceting,
+        batch_commands=True
+    )
+    stellarator.export_dagmc(filename=filename_exp)
+
+    assert Path(filename_exp).with_suffix('.h5m').exists()
+
+    remove_files()
+
+
+def test_read_ahead(stellarator):
+
+    remove_files()
+
+    construct_model(stellarator, magnets=False)
+
+    stellarator.build_cubit_model()
+
+    vol_ids_exp = [
+        data['vol_id']
+        for data in stellarator.radial_build.radial_build.values()
+    ]
+
+    reset_cubit()
+
+    filename_exp = 'dagmc_read_ahead'
+
+    stellarator.build_cubit_model(read_ahead=True)
+    stellarator.export_dagmc(filename=filename_exp)
+
+    vol_ids = [
+        data['vol_id']
+        for data in stellarator.radial_build.radial_build.values()
+    ]
+
+    assert vol_ids == vol_ids_exp
+    assert Path(filename_exp).with_suffix('.h5m').exists()
+
+    remove_files()
+
+
+def test_read_ahead_missing_file():
+
+    import parastell.cubit_io as cubit_io
+
+    with pytest.raises(FileNotFoundError):
+        cubit_io.read_ahead_step_files(
+            ['missing_component'], 'files_for_tests'
+        )
+
+
+def test_export_batch():
+
+    remove_files()
+
+    vmec_file = Path('files_for_tests') / 'wout_vmec.nc'
+
+    toroidal_angles = [0.0, 5.0, 10.0, 15.0]
+    poloidal_angles = [0.0, 120.0, 240.0, 360.0]
+
+    configs = []
+    for i, thickness in enumerate([10, 20]):
+        configs.append({
+            'vmec_file': vmec_file,
+            'invessel_build': {
+                'toroidal_angles': toroidal_angles,
+                'poloidal_angles': poloidal_angles,
+                'wall_s': 1.08,
+                'radial_build': {
+                    'component': {
+                        'thickness_matrix': np.ones(
+                            (len(toroidal_angles), len(poloidal_angles))
+                        )*thickness
+                    }
+                },
+                'num_ribs': 11
+            },
+            'dagmc_export': {
+                'filename': f'dagmc_batch_{i}'
+            }
+        })
+
+    ps.Stellarator.export_batch(configs)
+
+    assert Path('dagmc_batch_0.h5m').exists()
+    assert Path('dagmc_batch_1.h5m').exists()
+
+    remove_files()